@@ -1,4 +1,5 @@
-from typing import Optional, List
+import itertools
+from typing import Dict, Iterator, Optional, List, Tuple, Union
 from dataclasses import dataclass
 
 @dataclass
@@ -14,9 +15,27 @@ class AVLNode:
         self.right: Optional[AVLNode] = None
         self.height = 1
 
-class AVLTree:
-    def __init__(self):
-        self.root: Optional[AVLNode] = None
+NameKey = Tuple[str, int]
+
+def name_key(booking: Booking) -> NameKey:
+    """Sort key for the name index: case-folded name, then ID"""
+    return (booking.name.casefold(), booking.id)
+
+def _take(bookings: Iterator[Booking], limit: Optional[int]) -> List[Booking]:
+    """Collect up to limit bookings from an iterator (all of them if limit is None)"""
+    if limit is not None and limit <= 0:
+        return []
+    return list(itertools.islice(bookings, limit))
+
+class NameNode(AVLNode):
+    """Name index node caching its (name, id) key"""
+    
+    def __init__(self, booking: Booking):
+        super().__init__(booking)
+        self.key = name_key(booking)
+
+class _BalancedTree:
+    """Height bookkeeping and rotations shared by the AVL trees"""
     
     def _height(self, node: Optional[AVLNode]) -> int:
         """Get height of a node"""
@@ -87,6 +106,121 @@ class AVLTree:
         
         return node
     
+    def _find_min(self, node: AVLNode) -> AVLNode:
+        """Find the node with minimum value in a subtree"""
+        current = node
+        while current.left is not None:
+            current = current.left
+        return current
+
+class NameIndex(_BalancedTree):
+    """Secondary AVL tree ordering bookings by case-folded (name, id).
+    
+    Keys are taken when a booking is inserted. Rename by inserting a new
+    Booking with the same ID; changing Booking.name in place is not
+    reflected in the order.
+    """
+    
+    def __init__(self):
+        self.root: Optional[NameNode] = None
+        # Key each booking ID was indexed under, so removal does not depend on the current name
+        self._keys: Dict[int, NameKey] = {}
+    
+    def _insert_recursive(self, node: Optional[NameNode], booking: Booking, key: NameKey) -> NameNode:
+        """Recursively insert a booking into the name index"""
+        if node is None:
+            return NameNode(booking)
+        
+        if key < node.key:
+            node.left = self._insert_recursive(node.left, booking, key)
+        elif key > node.key:
+            node.right = self._insert_recursive(node.right, booking, key)
+        else:
+            node.booking = booking
+            return node
+        
+        return self._balance(node)
+    
+    def insert(self, booking: Booking):
+        """Insert a booking into the name index"""
+        key = name_key(booking)
+        self._keys[booking.id] = key
+        self.root = self._insert_recursive(self.root, booking, key)
+    
+    def _delete_recursive(self, node: Optional[NameNode], key: NameKey) -> Optional[NameNode]:
+        """Recursively delete a key from the name index"""
+        if node is None:
+            return None
+        
+        if key < node.key:
+            node.left = self._delete_recursive(node.left, key)
+        elif key > node.key:
+            node.right = self._delete_recursive(node.right, key)
+        else:
+            if node.left is None:
+                return node.right
+            elif node.right is None:
+                return node.left
+            
+            temp = self._find_min(node.right)
+            node.booking = temp.booking
+            node.key = temp.key
+            node.right = self._delete_recursive(node.right, temp.key)
+        
+        return self._balance(node)
+    
+    def key_of(self, booking_id: int) -> Optional[NameKey]:
+        """Get the key a booking ID is currently indexed under"""
+        return self._keys.get(booking_id)
+    
+    def delete(self, booking: Booking):
+        """Remove a booking from the name index"""
+        key = self._keys.pop(booking.id, None)
+        if key is not None:
+            self.root = self._delete_recursive(self.root, key)
+    
+    def _iter_nodes_from(self, key: Optional[Union[NameKey, Tuple[str]]], inclusive: bool) -> Iterator[NameNode]:
+        """Yield nodes in key order starting at key, in O(log n) plus O(1) per item"""
+        stack: List[NameNode] = []
+        node = self.root
+        while node is not None:
+            if key is None or node.key > key or (inclusive and node.key == key):
+                stack.append(node)
+                node = node.left
+            else:
+                node = node.right
+        
+        while stack:
+            node = stack.pop()
+            yield node
+            node = node.right
+            while node is not None:
+                stack.append(node)
+                node = node.left
+    
+    def iter_from(self, key: Optional[Union[NameKey, Tuple[str]]] = None, inclusive: bool = True) -> Iterator[Booking]:
+        """Yield bookings in name order starting at key"""
+        for node in self._iter_nodes_from(key, inclusive):
+            yield node.booking
+    
+    def iter_prefix(self, prefix: str) -> Iterator[Booking]:
+        """Yield bookings whose case-folded name starts with prefix, in name order"""
+        folded = prefix.casefold()
+        for node in self._iter_nodes_from((folded,), True):
+            if not node.key[0].startswith(folded):
+                break
+            yield node.booking
+    
+    def clear(self):
+        """Clear the name index"""
+        self.root = None
+        self._keys.clear()
+
+class AVLTree(_BalancedTree):
+    def __init__(self):
+        self.root: Optional[AVLNode] = None
+        self.name_index = NameIndex()
+    
     def _insert_recursive(self, node: Optional[AVLNode], booking: Booking) -> AVLNode:
         """Recursively insert a booking into the AVL tree"""
         if node is None:
@@ -105,14 +239,10 @@ class AVLTree:
     
     def insert(self, booking: Booking):
         """Insert a booking into the AVL tree"""
+        # Re-key the name index in case the passenger was renamed
+        self.name_index.delete(booking)
         self.root = self._insert_recursive(self.root, booking)
-    
-    def _find_min(self, node: AVLNode) -> AVLNode:
-        """Find the node with minimum value in a subtree"""
-        current = node
-        while current.left is not None:
-            current = current.left
-        return current
+        self.name_index.insert(booking)
     
     def _delete_recursive(self, node: Optional[AVLNode], booking_id: int) -> Optional[AVLNode]:
         """Recursively delete a booking from the AVL tree"""
@@ -147,6 +277,7 @@ class AVLTree:
             return None
         
         self.root = self._delete_recursive(self.root, booking_id)
+        self.name_index.delete(booking)
         return booking
     
     def _search_recursive(self, node: Optional[AVLNode], booking_id: int) -> Optional[Booking]:
@@ -189,6 +320,14 @@ class AVLTree:
         self._search_by_name_recursive(self.root, name, result)
         return result
     
+    def search_by_prefix(self, prefix: str, limit: Optional[int] = None) -> List[Booking]:
+        """Get bookings whose name starts with prefix, in name order"""
+        return _take(self.name_index.iter_prefix(prefix), limit)
+    
+    def get_bookings_by_name(self, after: Optional[NameKey] = None, limit: Optional[int] = None) -> List[Booking]:
+        """Get bookings in name order, optionally starting after a (name, id) key"""
+        return _take(self.name_index.iter_from(after, inclusive=after is None), limit)
+    
     def _range_search_recursive(self, node: Optional[AVLNode], start_id: int, end_id: int, result: List[Booking]):
         """Recursively search for bookings in a range"""
         if node is not None:
@@ -207,4 +346,5 @@ class AVLTree:
     
     def clear(self):
         """Clear all bookings"""
-        self.root = None 
\ No newline at end of file
+        self.root = None
+        self.name_index.clear() 
\ No newline at end of file
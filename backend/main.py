@@ -1,12 +1,15 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import List, Optional
 import json
+import base64
 from datetime import datetime
-from avl_tree import AVLTree, Booking
+from avl_tree import AVLTree, Booking, NameKey
+import profiling
 
 app = FastAPI(title="Flight Booking System API", version="1.0.0")
+profiling_settings = profiling.ProfilingSettings.from_env()
 
 # Enable CORS for frontend
 app.add_middleware(
@@ -15,6 +18,9 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"] + (
+        [profiling.PROFILE_STATS_HEADER] if profiling_settings.profiling_enabled else []
+    ),
 )
 
 # Pydantic models for API
@@ -35,6 +41,9 @@ avl_tree = AVLTree()
 seat_map = [[False for _ in range(4)] for _ in range(20)]  # 20 rows, 4 columns (A, B, C, D)
 next_booking_id = 1
 
+# Opt-in profiling and memory tracing (see FMS_PROFILE_* in README)
+profiling.install(app, avl_tree, profiling_settings)
+
 def get_seat_position(seat_code: str) -> tuple[Optional[int], Optional[int]]:
     """Convert seat code (e.g., 01D, 05C) to row and column indices"""
     if len(seat_code) < 2:
@@ -60,6 +69,21 @@ def get_seat_position(seat_code: str) -> tuple[Optional[int], Optional[int]]:
     except ValueError:
         return None, None
 
+def encode_name_cursor(key: NameKey) -> str:
+    """Encode a name-index key as an opaque cursor"""
+    raw = json.dumps(list(key)).encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+def decode_name_cursor(cursor: str) -> tuple[str, int]:
+    """Decode a cursor produced by encode_name_cursor"""
+    try:
+        name, booking_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if not isinstance(name, str) or not isinstance(booking_id, int):
+            raise ValueError
+        return name, booking_id
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor") from None
+
 def is_seat_available(seat_code: str) -> bool:
     """Check if a seat is available"""
     row, col = get_seat_position(seat_code)
@@ -95,9 +119,32 @@ async def root():
     return {"message": "Flight Booking System API"}
 
 @app.get("/bookings", response_model=List[BookingResponse])
-async def get_all_bookings():
-    """Get all bookings"""
-    bookings = avl_tree.get_all_bookings()
+async def get_all_bookings(
+    response: Response,
+    sort: str = "id",
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+):
+    """Get all bookings, ordered by ID or by passenger name.
+
+    With sort=name, pass limit to page through results; the next page's
+    cursor is returned in the X-Next-Cursor header.
+    """
+    if sort == "id":
+        if limit is not None or cursor is not None:
+            raise HTTPException(status_code=400, detail="Pagination requires sort=name")
+        bookings = avl_tree.get_all_bookings()
+    elif sort == "name":
+        if limit is not None and limit < 1:
+            raise HTTPException(status_code=400, detail="Limit must be positive")
+        after = decode_name_cursor(cursor) if cursor else None
+        # Fetch one extra booking to know whether another page follows
+        bookings = avl_tree.get_bookings_by_name(after, None if limit is None else limit + 1)
+        if limit is not None and len(bookings) > limit:
+            bookings = bookings[:limit]
+            response.headers["X-Next-Cursor"] = encode_name_cursor(avl_tree.name_index.key_of(bookings[-1].id))
+    else:
+        raise HTTPException(status_code=400, detail="Sort must be 'id' or 'name'")
     return [BookingResponse(id=b.id, name=b.name, seat=b.seat) for b in bookings]
 
 @app.get("/bookings/{booking_id}", response_model=BookingResponse)
@@ -168,6 +215,14 @@ async def search_bookings_by_name(name: str):
     matching_bookings = avl_tree.search_by_name(name)
     return [BookingResponse(id=b.id, name=b.name, seat=b.seat) for b in matching_bookings]
 
+@app.get("/bookings/search/prefix/{prefix}")
+async def search_bookings_by_prefix(prefix: str, limit: int = 10):
+    """Search bookings whose passenger name starts with prefix, in name order"""
+    if limit < 1:
+        raise HTTPException(status_code=400, detail="Limit must be positive")
+    matching_bookings = avl_tree.search_by_prefix(prefix, limit)
+    return [BookingResponse(id=b.id, name=b.name, seat=b.seat) for b in matching_bookings]
+
 @app.get("/bookings/range/{start_id}/{end_id}")
 async def get_bookings_in_range(start_id: int, end_id: int):
     """Get bookings within an ID range"""
@@ -0,0 +1,273 @@
+import cProfile
+import io
+import itertools
+import os
+import pstats
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import List, Optional
+
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import PlainTextResponse
+from starlette.concurrency import run_in_threadpool
+
+from avl_tree import AVLNode, AVLTree, NameNode
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_QUERY_PARAM = "profile"
+PROFILE_STATS_HEADER = "X-Profile-Stats"
+
+def _env_flag(name: str) -> bool:
+    """Read a boolean flag from the environment"""
+    return os.environ.get(name, "").strip().lower() in ("1", "true", "yes", "on")
+
+def _env_int(name: str, default: int) -> int:
+    """Read an integer from the environment, falling back to a default"""
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+@dataclass
+class ProfilingSettings:
+    # Allow a single request to opt in via the X-Profile header or ?profile=1
+    on_demand: bool = False
+    # Profile 1 in N requests (0 disables sampling)
+    sample_every: int = 0
+    # Enable tracemalloc and GET /debug/memory
+    trace_memory: bool = False
+    # Number of stack frames tracemalloc records per allocation
+    trace_frames: int = 1
+    # Where profile stats are written, and how many files are kept
+    store_dir: str = "profiles"
+    store_limit: int = 50
+
+    @classmethod
+    def from_env(cls) -> "ProfilingSettings":
+        """Build settings from FMS_PROFILE_* environment variables"""
+        return cls(
+            on_demand=_env_flag("FMS_PROFILE_ON_DEMAND"),
+            sample_every=max(_env_int("FMS_PROFILE_SAMPLE_EVERY", 0), 0),
+            trace_memory=_env_flag("FMS_PROFILE_TRACE_MEMORY"),
+            trace_frames=max(_env_int("FMS_PROFILE_TRACE_FRAMES", 1), 1),
+            store_dir=os.environ.get("FMS_PROFILE_DIR", "profiles"),
+            store_limit=max(_env_int("FMS_PROFILE_KEEP", 50), 1),
+        )
+
+    @property
+    def profiling_enabled(self) -> bool:
+        return self.on_demand or self.sample_every > 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.profiling_enabled or self.trace_memory
+
+class ProfileStore:
+    """Rotating on-disk store of cProfile stats files"""
+
+    def __init__(self, directory: str, limit: int):
+        self.directory = directory
+        self.limit = limit
+
+    def save(self, profiler: cProfile.Profile, label: str) -> str:
+        """Dump profiler stats to a new file and drop the oldest ones over the limit"""
+        os.makedirs(self.directory, exist_ok=True)
+        safe_label = "".join(c if c.isalnum() else "_" for c in label).strip("_") or "root"
+        name = f"{time.time_ns()}_{safe_label[:60]}.prof"
+        profiler.dump_stats(os.path.join(self.directory, name))
+        self._rotate()
+        return name
+
+    def list(self) -> List[str]:
+        """List stored profile names, newest first"""
+        if not os.path.isdir(self.directory):
+            return []
+        names = [n for n in os.listdir(self.directory) if n.endswith(".prof")]
+        return sorted(names, reverse=True)
+
+    def path(self, name: str) -> Optional[str]:
+        """Resolve a stored profile name to a path, rejecting anything outside the store"""
+        if os.path.basename(name) != name or not name.endswith(".prof"):
+            return None
+        path = os.path.join(self.directory, name)
+        return path if os.path.isfile(path) else None
+
+    def _rotate(self):
+        """Remove the oldest profiles beyond the configured limit"""
+        for name in self.list()[self.limit:]:
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+
+def format_stats(path: str, sort_by: str = "cumulative", limit: int = 50) -> str:
+    """Render a stored profile as pstats text"""
+    stream = io.StringIO()
+    stats = pstats.Stats(path, stream=stream)
+    stats.sort_stats(sort_by).print_stats(limit)
+    return stream.getvalue()
+
+def _iter_nodes(root: Optional[AVLNode]):
+    """Iterate over every node in a subtree without recursion"""
+    stack = [root] if root else []
+    while stack:
+        node = stack.pop()
+        yield node
+        if node.left:
+            stack.append(node.left)
+        if node.right:
+            stack.append(node.right)
+
+def _object_size(obj) -> int:
+    """Shallow size of an object plus its instance dict"""
+    size = sys.getsizeof(obj)
+    if hasattr(obj, "__dict__"):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+def _size_entry(count: int, total_bytes: int) -> dict:
+    """Summarize the memory used by one kind of object"""
+    return {
+        "count": count,
+        "total_bytes": total_bytes,
+        "bytes_per_object": total_bytes // count if count else 0,
+    }
+
+def memory_report(tree: AVLTree, top: int = 20) -> dict:
+    """Report per-object sizes for the booking tree and the top allocation sites"""
+    node_count = 0
+    node_bytes = 0
+    booking_bytes = 0
+    for node in _iter_nodes(tree.root):
+        node_count += 1
+        node_bytes += _object_size(node)
+        booking = node.booking
+        booking_bytes += (
+            _object_size(booking)
+            + sys.getsizeof(booking.name)
+            + sys.getsizeof(booking.seat)
+        )
+
+    # Name index nodes also hold their cached (folded name, id) key
+    name_node_count = 0
+    name_node_bytes = 0
+    for node in _iter_nodes(tree.name_index.root):
+        name_node_count += 1
+        name_node_bytes += (
+            _object_size(node)
+            + sys.getsizeof(node.key)
+            + sys.getsizeof(node.key[0])
+        )
+
+    snapshot = tracemalloc.take_snapshot().filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    ))
+    sites = [
+        {
+            "site": str(stat.traceback[0]),
+            "size_bytes": stat.size,
+            "count": stat.count,
+        }
+        for stat in snapshot.statistics("lineno")[:top]
+    ]
+    current, peak = tracemalloc.get_traced_memory()
+
+    return {
+        "objects": {
+            AVLNode.__name__: _size_entry(node_count, node_bytes),
+            NameNode.__name__: _size_entry(name_node_count, name_node_bytes),
+            "Booking": _size_entry(node_count, booking_bytes),
+        },
+        "traced_current_bytes": current,
+        "traced_peak_bytes": peak,
+        "top_allocation_sites": sites,
+    }
+
+def install(app: FastAPI, tree: AVLTree, settings: Optional[ProfilingSettings] = None):
+    """Attach profiling middleware and /debug routes to the app.
+
+    Nothing is registered when every option is disabled, so the default
+    configuration adds no per-request overhead.
+    """
+    settings = settings or ProfilingSettings.from_env()
+    if not settings.enabled:
+        return
+
+    if settings.profiling_enabled:
+        store = ProfileStore(settings.store_dir, settings.store_limit)
+        request_counter = itertools.count(1)
+        # cProfile can only have one active profiler at a time
+        busy = False
+
+        def is_requested(request: Request) -> bool:
+            return settings.on_demand and (
+                request.headers.get(PROFILE_HEADER) == "1"
+                or request.query_params.get(PROFILE_QUERY_PARAM) == "1"
+            )
+
+        def is_sampled() -> bool:
+            return bool(settings.sample_every) and next(request_counter) % settings.sample_every == 0
+
+        @app.middleware("http")
+        async def profile_request(request: Request, call_next):
+            nonlocal busy
+            if request.url.path.startswith("/debug/"):
+                return await call_next(request)
+
+            requested = is_requested(request)
+            if not requested and not is_sampled():
+                return await call_next(request)
+
+            if busy:
+                # Another request is being profiled; tell explicit callers why there are no stats
+                response = await call_next(request)
+                if requested:
+                    response.headers[PROFILE_STATS_HEADER] = "busy"
+                return response
+
+            busy = True
+            profiler = cProfile.Profile()
+            try:
+                profiler.enable()
+                try:
+                    response = await call_next(request)
+                finally:
+                    profiler.disable()
+            finally:
+                busy = False
+
+            # Writing and rotating stats touches the disk, so keep it off the event loop
+            name = await run_in_threadpool(store.save, profiler, f"{request.method}_{request.url.path}")
+            response.headers[PROFILE_STATS_HEADER] = f"/debug/profiles/{name}"
+            return response
+
+        @app.get("/debug/profiles")
+        async def list_profiles():
+            """List stored request profiles, newest first"""
+            return {"profiles": store.list()}
+
+        @app.get("/debug/profiles/{name}", response_class=PlainTextResponse)
+        async def get_profile(name: str, sort: str = "cumulative", limit: int = 50):
+            """Get a stored request profile as pstats text"""
+            path = store.path(name)
+            if path is None:
+                raise HTTPException(status_code=404, detail="Profile not found")
+            try:
+                return format_stats(path, sort, limit)
+            except KeyError:
+                raise HTTPException(status_code=400, detail="Invalid sort key") from None
+
+    if settings.trace_memory:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(settings.trace_frames)
+
+        @app.get("/debug/memory")
+        async def get_memory_report(top: int = 20):
+            """Get tree object sizes and the top allocation sites"""
+            if top < 1:
+                raise HTTPException(status_code=400, detail="Top must be positive")
+            return memory_report(tree, top)
@@ -3,6 +3,8 @@
 Test script for AVL tree implementation
 """
 
+import random
+
 from avl_tree import AVLTree, Booking
 
 def test_avl_tree():
@@ -89,5 +91,75 @@ def test_avl_tree():
     print("\n✅ All tests completed successfully!")
     print("🎉 AVL tree implementation is working correctly!")
 
+def test_name_index():
+    """Test the name-ordered secondary index"""
+    print("🧪 Testing Name Index...")
+    
+    tree = AVLTree()
+    for booking in [
+        Booking(id=4, name="carol Davis", seat="12C"),
+        Booking(id=1, name="Alice Johnson", seat="03A"),
+        Booking(id=3, name="alan Turing", seat="07B"),
+        Booking(id=2, name="Bob Smith", seat="01D"),
+        Booking(id=5, name="Alice Johnson", seat="20A"),
+    ]:
+        tree.insert(booking)
+    
+    # Test 1: Name order is case-insensitive, ties broken by ID
+    print("\n1. Testing name order...")
+    ordered = [b.id for b in tree.get_bookings_by_name()]
+    print(f"   Order: {ordered}")
+    assert ordered == [3, 1, 5, 2, 4]
+    
+    # Test 2: Prefix search
+    print("\n2. Testing prefix search...")
+    assert [b.id for b in tree.search_by_prefix("al")] == [3, 1, 5]
+    assert [b.id for b in tree.search_by_prefix("ALI", limit=1)] == [1]
+    assert tree.search_by_prefix("z") == []
+    
+    # Test 3: Paging after a key
+    print("\n3. Testing paging...")
+    page = tree.get_bookings_by_name(limit=2)
+    last = page[-1]
+    rest = tree.get_bookings_by_name(after=(last.name.casefold(), last.id))
+    assert [b.id for b in page + rest] == ordered
+    
+    # Test 4: Rename, delete and clear keep the index in sync
+    print("\n4. Testing rename, delete and clear...")
+    tree.insert(Booking(id=2, name="Aaron Smith", seat="01D"))
+    assert [b.id for b in tree.get_bookings_by_name()] == [2, 3, 1, 5, 4]
+    assert tree.search_by_prefix("bob") == []
+    tree.delete(1)
+    assert [b.id for b in tree.search_by_prefix("alice")] == [5]
+    tree.clear()
+    assert tree.get_bookings_by_name() == []
+    
+    # Test 5: Deleting still works after an (unsupported) in-place name change
+    print("\n5. Testing delete after in-place name change...")
+    mutable = Booking(id=7, name="Zed", seat="02A")
+    tree.insert(mutable)
+    tree.insert(Booking(id=8, name="Amy", seat="02B"))
+    mutable.name = "Abe"
+    tree.delete(7)
+    assert [b.id for b in tree.get_bookings_by_name()] == [8]
+    tree.clear()
+    
+    # Test 6: Index matches a sorted scan after many random operations
+    print("\n6. Testing consistency under random operations...")
+    rng = random.Random(42)
+    names = ["ann", "Anna", "bo", "BOB", "cy", "Cyd", "dee"]
+    for _ in range(500):
+        booking_id = rng.randint(1, 60)
+        if rng.random() < 0.3:
+            tree.delete(booking_id)
+        else:
+            tree.insert(Booking(id=booking_id, name=rng.choice(names), seat="01A"))
+    expected = sorted(tree.get_all_bookings(), key=lambda b: (b.name.casefold(), b.id))
+    assert tree.get_bookings_by_name() == expected
+    assert tree.search_by_prefix("an") == [b for b in expected if b.name.casefold().startswith("an")]
+    
+    print("\n✅ Name index tests completed successfully!")
+
 if __name__ == "__main__":
-    test_avl_tree() 
\ No newline at end of file
+    test_avl_tree()
+    test_name_index()
\ No newline at end of file
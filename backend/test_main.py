@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Test script for the name-ordered API endpoints
+"""
+
+from fastapi.testclient import TestClient
+
+from main import app
+
+client = TestClient(app)
+
+def create_bookings():
+    """Reset the API state and add a few bookings"""
+    client.delete("/bookings")
+    for name, seat in [("carol", "01A"), ("Alice", "01B"), ("bob", "01C"), ("alan", "01D"), ("Dave", "02A")]:
+        assert client.post("/bookings", json={"name": name, "seat": seat}).status_code == 200
+
+def test_sort_by_name_pagination():
+    """Test paging through GET /bookings?sort=name with X-Next-Cursor"""
+    print("🧪 Testing name-sorted pagination...")
+    create_bookings()
+
+    names = []
+    params = {"sort": "name", "limit": 2}
+    while True:
+        response = client.get("/bookings", params=params)
+        assert response.status_code == 200
+        names += [b["name"] for b in response.json()]
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+        params["cursor"] = cursor
+
+    assert names == ["alan", "Alice", "bob", "carol", "Dave"]
+    unpaged = [b["name"] for b in client.get("/bookings", params={"sort": "name"}).json()]
+    assert unpaged == names
+    print("   ✅ Pages cover every booking in name order")
+
+def test_sort_by_name_errors():
+    """Test 400 responses for invalid sort, limit and cursor"""
+    print("🧪 Testing sort/pagination errors...")
+    create_bookings()
+
+    assert client.get("/bookings", params={"sort": "name", "cursor": "not-a-cursor"}).status_code == 400
+    assert client.get("/bookings", params={"sort": "name", "cursor": "MTIz"}).status_code == 400
+    assert client.get("/bookings", params={"sort": "name", "limit": 0}).status_code == 400
+    assert client.get("/bookings", params={"limit": 2}).status_code == 400
+    assert client.get("/bookings", params={"sort": "seat"}).status_code == 400
+    assert len(client.get("/bookings").json()) == 5
+    print("   ✅ Invalid parameters rejected")
+
+def test_prefix_search():
+    """Test GET /bookings/search/prefix/{prefix}"""
+    print("🧪 Testing prefix search...")
+    create_bookings()
+
+    response = client.get("/bookings/search/prefix/AL")
+    assert [b["name"] for b in response.json()] == ["alan", "Alice"]
+    response = client.get("/bookings/search/prefix/al", params={"limit": 1})
+    assert [b["name"] for b in response.json()] == ["alan"]
+    assert client.get("/bookings/search/prefix/al", params={"limit": 0}).status_code == 400
+
+    client.delete("/bookings")
+    for i in range(12):
+        client.post("/bookings", json={"name": f"Sam {i:02d}", "seat": f"{i + 1:02d}A"})
+    # Default limit is 10
+    assert len(client.get("/bookings/search/prefix/sam").json()) == 10
+    client.delete("/bookings")
+    print("   ✅ Prefix search honours limit")
+
+if __name__ == "__main__":
+    test_sort_by_name_pagination()
+    test_sort_by_name_errors()
+    test_prefix_search()
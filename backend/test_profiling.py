@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Test script for the profiling hooks
+"""
+
+import cProfile
+import os
+import tempfile
+import tracemalloc
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from avl_tree import AVLTree, Booking
+import profiling
+from profiling import ProfileStore, ProfilingSettings
+
+def test_settings_from_env():
+    """Test parsing and clamping of FMS_PROFILE_* variables"""
+    print("🧪 Testing Profiling Settings...")
+
+    keys = ["FMS_PROFILE_ON_DEMAND", "FMS_PROFILE_SAMPLE_EVERY", "FMS_PROFILE_TRACE_MEMORY",
+            "FMS_PROFILE_TRACE_FRAMES", "FMS_PROFILE_DIR", "FMS_PROFILE_KEEP"]
+    saved = {key: os.environ.pop(key, None) for key in keys}
+    try:
+        settings = ProfilingSettings.from_env()
+        assert not settings.enabled
+
+        os.environ.update({
+            "FMS_PROFILE_ON_DEMAND": "yes",
+            "FMS_PROFILE_SAMPLE_EVERY": "-5",
+            "FMS_PROFILE_TRACE_FRAMES": "0",
+            "FMS_PROFILE_KEEP": "not a number",
+        })
+        settings = ProfilingSettings.from_env()
+        assert settings.on_demand and settings.enabled
+        assert settings.sample_every == 0
+        assert settings.trace_frames == 1
+        assert settings.store_limit == 50
+    finally:
+        for key, value in saved.items():
+            os.environ.pop(key, None)
+            if value is not None:
+                os.environ[key] = value
+
+    print("   ✅ Settings parsed and clamped")
+
+def test_profile_store():
+    """Test rotation and name validation in the profile store"""
+    print("🧪 Testing Profile Store...")
+
+    store = ProfileStore(tempfile.mkdtemp(), limit=3)
+    names = []
+    for _ in range(5):
+        profiler = cProfile.Profile()
+        profiler.enable()
+        sum(range(100))
+        profiler.disable()
+        names.append(store.save(profiler, "GET /bookings"))
+
+    assert store.list() == sorted(names[-3:], reverse=True)
+    assert store.path(names[-1]) is not None
+    assert store.path(names[0]) is None
+    assert store.path("../x.prof") is None
+    assert store.path("x.txt") is None
+    assert "function calls" in profiling.format_stats(store.path(names[-1]))
+
+    print("   ✅ Store keeps the newest 3 profiles")
+
+def test_install_disabled():
+    """Test that nothing is registered when profiling is off"""
+    print("🧪 Testing install() with profiling off...")
+
+    app = FastAPI()
+    routes_before = [route.path for route in app.routes]
+    profiling.install(app, AVLTree(), ProfilingSettings())
+    assert app.user_middleware == []
+    assert [route.path for route in app.routes] == routes_before
+
+    print("   ✅ No middleware or routes registered")
+
+def test_on_demand_profile():
+    """Test profiling a request through the X-Profile header"""
+    print("🧪 Testing on-demand profiling...")
+
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    settings = ProfilingSettings(on_demand=True, store_dir=tempfile.mkdtemp())
+    profiling.install(app, AVLTree(), settings)
+    client = TestClient(app)
+
+    assert "X-Profile-Stats" not in client.get("/ping").headers
+    stats_url = client.get("/ping", headers={"X-Profile": "1"}).headers["X-Profile-Stats"]
+    assert stats_url.startswith("/debug/profiles/")
+    assert client.get(stats_url).status_code == 200
+    assert client.get(stats_url, params={"sort": "bogus"}).status_code == 400
+    assert client.get("/debug/profiles/missing.prof").status_code == 404
+    assert client.get("/debug/profiles").json()["profiles"] == [stats_url.rsplit("/", 1)[1]]
+
+    print("   ✅ Profile stored and served")
+
+def test_memory_report():
+    """Test per-object counts in the memory report"""
+    print("🧪 Testing memory report...")
+
+    tree = AVLTree()
+    for booking_id in range(1, 6):
+        tree.insert(Booking(id=booking_id, name=f"Passenger {booking_id}", seat=f"0{booking_id}A"))
+
+    # Leave tracing alone if something else (e.g. the app) already started it
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        report = profiling.memory_report(tree, top=5)
+    finally:
+        if started:
+            tracemalloc.stop()
+    assert report["objects"]["AVLNode"]["count"] == 5
+    assert report["objects"]["NameNode"]["count"] == 5
+    assert report["objects"]["Booking"]["count"] == 5
+    # Name index nodes carry their cached key on top of the plain node size
+    assert (report["objects"]["NameNode"]["bytes_per_object"]
+            > report["objects"]["AVLNode"]["bytes_per_object"])
+    assert report["objects"]["Booking"]["bytes_per_object"] > 0
+    assert len(report["top_allocation_sites"]) <= 5
+
+    print("   ✅ Memory report counts match the tree")
+
+def test_memory_endpoint():
+    """Test validation of GET /debug/memory"""
+    print("🧪 Testing memory endpoint...")
+
+    started = not tracemalloc.is_tracing()
+    app = FastAPI()
+    profiling.install(app, AVLTree(), ProfilingSettings(trace_memory=True))
+    client = TestClient(app)
+    try:
+        assert client.get("/debug/memory", params={"top": 3}).status_code == 200
+        assert client.get("/debug/memory", params={"top": 0}).status_code == 400
+        assert client.get("/debug/memory", params={"top": -1}).status_code == 400
+    finally:
+        if started:
+            tracemalloc.stop()
+
+    print("   ✅ Invalid top rejected")
+
+if __name__ == "__main__":
+    test_settings_from_env()
+    test_profile_store()
+    test_install_disabled()
+    test_on_demand_profile()
+    test_memory_report()
+    test_memory_endpoint()